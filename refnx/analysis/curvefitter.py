@@ -408,7 +408,8 @@ class CurveFitter:
 
         # use the prior to initialise position
         elif pos == "prior":
-            arr = np.zeros((_ntemps, nwalkers, nvary))
+            # every column is filled below, no need to zero the array
+            arr = np.empty((_ntemps, nwalkers, nvary))
             LHC = LatinHypercube(nvary, seed=random_state)
             samples = LHC.random(n=_ntemps * nwalkers).reshape(
                 _ntemps, nwalkers, nvary
@@ -727,7 +728,16 @@ class CurveFitter:
             installed.
         kws : dict
             Additional arguments are passed to the underlying minimization
-            method.
+            method. For `differential_evolution` ``vectorized=True`` may be
+            supplied (SciPy >= 1.9.0). This is for compatibility only (e.g.
+            with constraints from
+            :meth:`refnx.reflect.LipidLeaflet.make_constraint`). Each member
+            of the population is still evaluated one at a time, so there is
+            no speed gain. Alternatively, ``workers=-1``
+            distributes evaluation of the population over all available
+            processors, in which case the objective must be picklable (e.g.
+            the model function must be defined at the top level of a
+            module).
 
         Returns
         -------
@@ -755,7 +765,9 @@ class CurveFitter:
 
         _min_kws = {}
         _min_kws.update(kws)
-        _bounds = bounds_list(self.objective.varying_parameters())
+        # (K, 2) sequence of (lb, ub) pairs, the layout the scipy minimizers
+        # expect
+        _bounds = bounds_list(_varying_parameters)
         _min_kws["bounds"] = _bounds
 
         # setup callback default
@@ -792,6 +804,27 @@ class CurveFitter:
         elif method in ["differential_evolution", "dual_annealing", "shgo"]:
             mini = getattr(sciopt, method)
 
+            if method == "differential_evolution" and (
+                kws.get("vectorized") or kws.get("workers", 1) != 1
+            ):
+                # evaluating the population all at once, or in parallel, is
+                # only possible with deferred updating
+                _min_kws.setdefault("updating", "deferred")
+
+            if method == "differential_evolution" and kws.get("vectorized"):
+                # a vectorized differential_evolution supplies the whole
+                # population at once, each trial vector being a column of an
+                # (N, S) array. Polishing still supplies a single vector.
+                # The objective can't evaluate many vectors at once, so they
+                # are evaluated one by one.
+                _cost = cost
+
+                def cost(x):
+                    x = np.asarray(x)
+                    if x.ndim == 1:
+                        return _cost(x)
+                    return np.array([_cost(xi) for xi in x.T])
+
             if method == "shgo":
                 if "n" not in _min_kws:
                     _min_kws["n"] = 100
@@ -387,7 +387,6 @@ class Objective(BaseObjective):
             The y data, its uncertainties, and the model, all put through the
              transform.
         """
-        x = self.data.x
         y = self.data.y
 
         y_err = 1.0
@@ -397,6 +396,9 @@ class Objective(BaseObjective):
         if self.transform is None:
             return y, y_err, model
         else:
+            # only retrieve x if it's needed, for a masked dataset each access
+            # creates a new array.
+            x = self.data.x
             if model is not None:
                 model, _ = self.transform(x, model)
 
@@ -473,7 +475,9 @@ class Objective(BaseObjective):
         # TODO reduced chisqr? include z-scores for parameters? DOF?
         self.setp(pvals)
         res = self.residuals(None)
-        return np.sum(res * res)
+        # vdot flattens and reduces in a single BLAS call, without creating
+        # a temporary for the squared residuals.
+        return np.vdot(res, res)
 
     @property
     def parameters(self):
@@ -507,16 +511,16 @@ class Objective(BaseObjective):
         # Parameters object
         _varying_parameters = self.varying_parameters()
         if len(pvals) == len(_varying_parameters):
-            for idx, param in enumerate(_varying_parameters):
-                param.value = pvals[idx]
+            for param, val in zip(_varying_parameters, pvals):
+                param.value = val
             return
 
         # values supplied are enough to specify all parameter values
         # even those that are repeated
         flattened_parameters = list(flatten(self.parameters))
         if len(pvals) == len(flattened_parameters):
-            for idx, param in enumerate(flattened_parameters):
-                param.value = pvals[idx]
+            for param, val in zip(flattened_parameters, pvals):
+                param.value = val
             return
 
         raise ValueError(
@@ -643,8 +647,6 @@ class Objective(BaseObjective):
 
         model = self.model(self.data.x, x_err=self.data.x_err)
 
-        logl = 0.0
-
         y, y_err, model = self._data_transform(model)
 
         if self.lnsigma is not None:
@@ -652,14 +654,17 @@ class Objective(BaseObjective):
                 y_err * y_err + np.exp(2 * float(self.lnsigma)) * model * model
             )
         else:
-            var_y = y_err**2
+            var_y = y_err * y_err
+
+        # accumulate in place to avoid creating temporaries
+        logl = y - model
+        logl *= logl
+        logl /= var_y
 
         # TODO do something sensible if data isn't weighted
         if self.weighted:
             logl += np.log(2 * np.pi * var_y)
 
-        logl += (y - model) ** 2 / var_y
-
         # nans play havoc
         if np.isnan(logl).any():
             raise RuntimeError("Objective.logl encountered a NaN.")
@@ -759,8 +764,7 @@ class Objective(BaseObjective):
         if target in ["nll", "nlpost"]:
             covar = super().covar(target)
 
-        pvar = np.diagonal(covar).copy()
-        psingular = np.where(pvar == 0)[0]
+        psingular = np.flatnonzero(np.diagonal(covar) == 0)
 
         if len(psingular) > 0:
             var_params = self.varying_parameters()
@@ -1057,6 +1061,35 @@ class GlobalObjective(Objective):
 
         return np.concatenate(residuals)
 
+    def chisqr(self, pvals=None):
+        """
+        Calculates the chi-squared value for the global fitting system.
+
+        Parameters
+        ----------
+        pvals : array-like or refnx.analysis.Parameters
+            values for the varying or entire set of parameters
+
+        Returns
+        -------
+        chisqr : float
+            Chi-squared value, `np.sum(residuals**2)`.
+
+        Notes
+        -----
+        The chi-squared value of each objective is scaled by the square of its
+        Lagrangian multiplier, consistent with :meth:`residuals`. The sum is
+        accumulated objective by objective, without concatenating the
+        residual arrays.
+        """
+        self.setp(pvals)
+
+        chisqr = 0.0
+        for objective, _lambda in zip(self.objectives, self.lambdas):
+            chisqr += _lambda * _lambda * objective.chisqr()
+
+        return chisqr
+
     @property
     def parameters(self):
         """
@@ -1354,11 +1387,14 @@ class Transform:
                     RuntimeWarning,
                 )
         elif self.form == "YX4":
-            yt = y * np.power(x, 4)
-            et = etemp * np.power(x, 4)
+            x2 = np.square(x)
+            x4 = x2 * x2
+            yt = y * x4
+            et = etemp * x4
         elif self.form == "YX2":
-            yt = y * np.power(x, 2)
-            et = etemp * np.power(x, 2)
+            x2 = np.square(x)
+            yt = y * x2
+            et = etemp * x2
         if y_err is None:
             return yt, None
         else:
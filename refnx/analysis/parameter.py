@@ -345,9 +345,9 @@ class Parameters(UserList):
         # it's still possible to have chains, even if there are no varying
         # parameters, if there are parameters that have constraints
         # generate for all params that have chains.
-        chain_pars = [
-            i for i, p in enumerate(self.flattened()) if p.chain is not None
-        ]
+        chain_pars = np.array(
+            [p.chain is not None for p in self.flattened()], dtype=bool
+        )
 
         chains = np.array(
             [
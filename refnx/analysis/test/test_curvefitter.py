@@ -583,6 +583,17 @@ class TestFitterGauss:
             res = f.fit(method=method, **opts)
             assert_allclose(res.x, self.best_weighted, rtol=0.005)
 
+        # a vectorized differential_evolution supplies the whole population
+        # in one go
+        self.objective.setp(self.p0)
+        res = f.fit(method="differential_evolution", seed=1, vectorized=True)
+        assert_allclose(res.x, self.best_weighted, rtol=0.005)
+
+        # population evaluated in parallel
+        self.objective.setp(self.p0)
+        res = f.fit(method="differential_evolution", seed=1, workers=2)
+        assert_allclose(res.x, self.best_weighted, rtol=0.005)
+
         # smoke test to check that we can use nlpost
         self.objective.setp(self.p0)
         logp0 = self.objective.logp()
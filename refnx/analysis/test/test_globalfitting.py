@@ -175,6 +175,10 @@ class TestGlobalFitting:
 
         # test lagrangian multipliers
         global_objective.lambdas = np.array([1.1, 2.2, 3.3])
+        assert_allclose(
+            global_objective.chisqr(),
+            np.sum(global_objective.residuals() ** 2),
+        )
         assert_allclose(
             global_objective.logl(),
             1.1 * objective361.logl()
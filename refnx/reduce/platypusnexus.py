@@ -2753,7 +2753,7 @@ def background_subtract_line(profile, profile_sd, background_mask):
 
     # which values to use as a background region
     mask = np.array(background_mask).astype("bool")
-    x_vals = np.where(mask)[0]
+    x_vals = np.flatnonzero(mask)
 
     if np.size(x_vals) < 2:
         # can't do a background subtraction if you have less than 2 points in
@@ -206,6 +206,19 @@ class LipidLeaflet(Component):
         self.reverse_monolayer = reverse_monolayer
         self.name = name
 
+        self._parameters = Parameters(name=name)
+
+        self.__cached_slabs = {"key": None, "slabs": None}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # LipidLeaflets pickled by older versions of refnx don't have these
+        # attributes
+        if "_LipidLeaflet__cached_slabs" not in state:
+            self.__cached_slabs = {"key": None, "slabs": None}
+        if "_parameters" not in state:
+            self._parameters = Parameters(name=self.name)
+
     def __repr__(self):
         d = {}
         d.update(self.__dict__)
@@ -232,75 +245,129 @@ class LipidLeaflet(Component):
         structure : refnx.reflect.Structure
             The Structure hosting this Component
         """
-        layers = np.zeros((2, 5))
-
-        # thicknesses
-        layers[0, 0] = float(self.thickness_heads)
-        layers[1, 0] = float(self.thickness_tails)
-
-        # real and imag SLD's
-        layers[0, 1] = float(self.b_heads_real) / float(self.vm_heads) * 1.0e6
-        layers[0, 2] = float(self.b_heads_imag) / float(self.vm_heads) * 1.0e6
-
-        layers[1, 1] = float(self.b_tails_real) / float(self.vm_tails) * 1.0e6
-        layers[1, 2] = float(self.b_tails_imag) / float(self.vm_tails) * 1.0e6
-
-        # roughnesses
-        layers[0, 3] = float(self.rough_preceding_mono)
-        layers[1, 3] = float(self.rough_head_tail)
-
-        # volume fractions
-        # head region
-        layers[0, 4] = 1 - self.volfrac_h
-
+        wavelength = getattr(structure, "wavelength", None)
+        _head_solvent = _tail_solvent = None
         if self.head_solvent is not None:
-            _head_solvent = self.head_solvent.complex(
-                getattr(structure, "wavelength", None)
-            )
-            # we do the solvation here, not in Structure.slabs
-            layers[0] = overall_sld(layers[0], _head_solvent)
-            layers[0, 4] = 0
-
-        # tail region
-        layers[1, 4] = 1 - self.volfrac_t
+            _head_solvent = self.head_solvent.complex(wavelength)
         if self.tail_solvent is not None:
-            _tail_solvent = self.tail_solvent.complex(
-                getattr(structure, "wavelength", None)
-            )
-            # we do the solvation here, not in Structure.slabs
-            layers[1] = overall_sld(layers[1], _tail_solvent)
-            layers[1, 4] = 0
+            _tail_solvent = self.tail_solvent.complex(wavelength)
+
+        # extract all the values once
+        apm = float(self.apm)
+        b_heads_real = float(self.b_heads_real)
+        b_heads_imag = float(self.b_heads_imag)
+        vm_heads = float(self.vm_heads)
+        thickness_heads = float(self.thickness_heads)
+        b_tails_real = float(self.b_tails_real)
+        b_tails_imag = float(self.b_tails_imag)
+        vm_tails = float(self.vm_tails)
+        thickness_tails = float(self.thickness_tails)
+        rough_head_tail = float(self.rough_head_tail)
+        rough_preceding_mono = float(self.rough_preceding_mono)
+
+        # slabs only need to be recalculated if any of the values they depend
+        # on have changed since the last call.
+        key = (
+            apm,
+            b_heads_real,
+            b_heads_imag,
+            vm_heads,
+            thickness_heads,
+            b_tails_real,
+            b_tails_imag,
+            vm_tails,
+            thickness_tails,
+            rough_head_tail,
+            rough_preceding_mono,
+            _head_solvent,
+            _tail_solvent,
+            self.reverse_monolayer,
+        )
+        if key == self.__cached_slabs["key"]:
+            return np.copy(self.__cached_slabs["slabs"])
+
+        # volume fractions of lipid in head and tail regions (see volfrac_h,
+        # volfrac_t), calculated from the values already extracted
+        volfrac_h = vm_heads / (apm * thickness_heads)
+        volfrac_t = vm_tails / (apm * thickness_tails)
+
+        # SLD = b / vm * 1e6, in units of 10**-6 Angstrom**-2
+        inv_vm_heads = 1.0e6 / vm_heads
+        inv_vm_tails = 1.0e6 / vm_tails
+
+        # columns are thickness, SLD.real, SLD.imag, roughness and volume
+        # fraction of solvent.
+        heads = (
+            thickness_heads,
+            b_heads_real * inv_vm_heads,
+            b_heads_imag * inv_vm_heads,
+            0,
+            1 - volfrac_h,
+        )
+        tails = (
+            thickness_tails,
+            b_tails_real * inv_vm_tails,
+            b_tails_imag * inv_vm_tails,
+            0,
+            1 - volfrac_t,
+        )
 
         if self.reverse_monolayer:
-            layers = np.flipud(layers)
-            layers[:, 3] = layers[::-1, 3]
-
-        return layers
+            layers = np.array([tails, heads])
+            heads_layer, tails_layer = layers[1], layers[0]
+        else:
+            layers = np.array([heads, tails])
+            heads_layer, tails_layer = layers[0], layers[1]
+
+        # roughnesses. The first layer is always adjacent to the preceding
+        # component, regardless of the monolayer orientation.
+        layers[0, 3] = rough_preceding_mono
+        layers[1, 3] = rough_head_tail
+
+        # we do the solvation here, not in Structure.slabs. There's no need
+        # to average with the solvent if the region contains no solvent.
+        if _head_solvent is not None:
+            if abs(heads[4]) > 1e-12:
+                overall_sld(heads_layer, _head_solvent)
+            heads_layer[4] = 0
+
+        if _tail_solvent is not None:
+            if abs(tails[4]) > 1e-12:
+                overall_sld(tails_layer, _tail_solvent)
+            tails_layer[4] = 0
+
+        self.__cached_slabs["key"] = key
+        self.__cached_slabs["slabs"] = layers
+        # return a copy so the cached array can't be modified by the caller
+        return np.copy(layers)
 
     @property
     def parameters(self):
-        p = Parameters(name=self.name)
-        p.extend(
-            [
-                self.apm,
-                self.b_heads_real,
-                self.b_heads_imag,
-                self.vm_heads,
-                self.thickness_heads,
-                self.b_tails_real,
-                self.b_tails_imag,
-                self.vm_tails,
-                self.thickness_tails,
-                self.rough_head_tail,
-                self.rough_preceding_mono,
-            ]
-        )
+        """
+        :class:`refnx.analysis.Parameters` associated with this component
+
+        """
+        data = [
+            self.apm,
+            self.b_heads_real,
+            self.b_heads_imag,
+            self.vm_heads,
+            self.thickness_heads,
+            self.b_tails_real,
+            self.b_tails_imag,
+            self.vm_tails,
+            self.thickness_tails,
+            self.rough_head_tail,
+            self.rough_preceding_mono,
+        ]
         if self.head_solvent is not None:
-            p.append(self.head_solvent.parameters)
+            data.append(self.head_solvent.parameters)
         if self.tail_solvent is not None:
-            p.append(self.tail_solvent.parameters)
+            data.append(self.tail_solvent.parameters)
 
-        return p
+        self._parameters.name = self.name
+        self._parameters.data = data
+        return self._parameters
 
     def logp(self):
         # penalise unphysical volume fractions.
@@ -345,6 +412,8 @@ class LipidLeaflet(Component):
         system.
         The Objective you supply must be for the overall curve fitting system.
         i.e. possibly a GlobalObjective.
+        The constraint can also be used with a vectorized
+        differential_evolution (`vectorized=True`).
 
         Examples
         --------
@@ -355,7 +424,17 @@ class LipidLeaflet(Component):
         """
 
         def con(x):
-            objective.setp(x)
-            return self.volfrac_h, self.volfrac_t
+            x = np.asarray(x)
+            if x.ndim == 1:
+                objective.setp(x)
+                return self.volfrac_h, self.volfrac_t
+
+            # a vectorized differential_evolution supplies x with shape
+            # (N, S), S being the number of solutions. Return shape (2, S).
+            vals = np.empty((2, x.shape[1]))
+            for i, xi in enumerate(x.T):
+                objective.setp(xi)
+                vals[:, i] = self.volfrac_h, self.volfrac_t
+            return vals
 
         return NonlinearConstraint(con, 0, 1)
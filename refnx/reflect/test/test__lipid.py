@@ -1,5 +1,6 @@
 import numpy as np
 import os.path
+import pickle
 from numpy.testing import (
     assert_almost_equal,
     assert_equal,
@@ -8,6 +9,7 @@ from numpy.testing import (
 )
 from scipy.optimize._constraints import PreparedConstraint
 import refnx
+from refnx.reflect import _lipid
 
 # the analysis module contains the curvefitting engine
 from refnx.analysis import CurveFitter, Objective
@@ -20,7 +22,10 @@ from refnx.reflect import (
     Slab,
     LipidLeaflet,
 )
-from refnx.reflect.structure import _profile_slicer
+from refnx.reflect.structure import (
+    _profile_slicer,
+    overall_sld as _overall_sld,
+)
 from refnx.analysis import Parameter, Interval
 
 # the ReflectDataset object will contain the data
@@ -70,6 +75,39 @@ class TestLipidLeaflet:
         theoretical[:, 3] = theoretical[::-1, 3]
         assert_allclose(self.leaflet.slabs(), theoretical, rtol=1e-15)
 
+    def test_slabs_cache(self):
+        # slabs are recalculated only when one of the values changes
+        slabs = self.leaflet.slabs()
+
+        # modifying the returned array shouldn't affect the leaflet
+        slabs[:] = 0
+        assert_allclose(self.leaflet.slabs()[0, 0], self.thick_h)
+
+        self.leaflet.thickness_heads.value = 10.0
+        assert_allclose(self.leaflet.slabs()[0, 0], 10.0)
+
+        self.leaflet.reverse_monolayer = True
+        assert_allclose(self.leaflet.slabs()[1, 0], 10.0)
+
+        self.leaflet.reverse_monolayer = False
+        self.leaflet.head_solvent = SLD(1.23)
+        assert_allclose(self.leaflet.slabs()[0, 4], 0)
+
+    def test_pickle(self):
+        # a LipidLeaflet pickled by an older version of refnx doesn't have
+        # the slab cache, or the Parameters container
+        del self.leaflet._LipidLeaflet__cached_slabs
+        del self.leaflet._parameters
+        leaflet = pickle.loads(pickle.dumps(self.leaflet))
+        assert_allclose(
+            leaflet.slabs(),
+            [
+                [self.thick_h, self.rho_h, 0, 3, self.phi_solv_h],
+                [self.thick_t, self.rho_t, 0, 2, self.phi_solv_t],
+            ],
+        )
+        assert_equal(len(leaflet.parameters), 11)
+
     def test_solvent_penetration(self):
         # check different types of solvation for heads/tails.
         self.leaflet.head_solvent = SLD(1.23)
@@ -89,6 +127,35 @@ class TestLipidLeaflet:
         )
         assert_allclose(slabs[1, 4], 0)
 
+        # solvation should be applied to the correct layers when the
+        # monolayer is reversed
+        self.leaflet.head_solvent = SLD(2.5)
+        theoretical = np.flipud(self.leaflet.slabs())
+        theoretical[:, 3] = theoretical[::-1, 3]
+        self.leaflet.reverse_monolayer = True
+        assert_allclose(self.leaflet.slabs(), theoretical)
+
+    def test_solvent_penetration_skipped(self, monkeypatch):
+        # solvent averaging isn't done for a region that contains no solvent
+        solvated = []
+
+        def overall_sld(slabs, solvent):
+            solvated.append(np.copy(slabs))
+            return _overall_sld(slabs, solvent)
+
+        monkeypatch.setattr(_lipid, "overall_sld", overall_sld)
+
+        self.leaflet.head_solvent = SLD(1.23)
+        self.leaflet.tail_solvent = SLD(1.23)
+        # fully packed head region
+        self.leaflet.thickness_heads.value = self.V_h / self.APM
+
+        slabs = self.leaflet.slabs()
+        assert_equal(len(solvated), 1)
+        assert_equal(solvated[0][0], self.thick_t)
+        assert_allclose(slabs[0, 1], self.rho_h)
+        assert_equal(slabs[:, 4], 0)
+
     def test_initialisation_with_SLD(self):
         # we should be able to initialise with SLD objects
         heads = SLD(6.01e-4 + 0j)
@@ -234,3 +301,12 @@ def test_lipid_leaflet_example():
     assert (v2 > 0).all()
 
     assert not np.allclose(v1, v2)
+
+    # vectorized constraint evaluation, with x of shape (N, S)
+    arr2 = np.array(objective_d2o.parameters)
+    apm.value = 56.0
+    arr1 = np.array(objective_d2o.parameters)
+    vals = con_inner.fun(np.column_stack([arr1, arr2]))
+    assert_equal(np.shape(vals), (2, 2))
+    assert_allclose(vals[:, 0], con_inner.fun(arr1))
+    assert_allclose(vals[:, 1], con_inner.fun(arr2))